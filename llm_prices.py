@@ -16,11 +16,18 @@ Usage:
 Zero dependencies. Python 3.8+.
 """
 
-import argparse
-import json
+from __future__ import annotations
+
+import os
 import sys
-from dataclasses import dataclass
-from typing import List, Optional
+from io import StringIO
+from itertools import starmap
+from types import SimpleNamespace
+
+# typing pulls in re/collections/functools; annotations only need it for checkers
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import List, Optional, Sequence
 
 __version__ = "0.1.0"
 
@@ -28,17 +35,85 @@ __version__ = "0.1.0"
 # Last updated: 2026-02-12
 # Sources: Official API pricing pages
 
-@dataclass
+CATEGORY_ICON = {
+    "reasoning": "🧠",
+    "general": "⚡",
+    "fast": "🚀",
+    "embedding": "📐",
+    "image": "🖼️",
+}
+
+def _price_tier(price: float) -> int:
+    """Colour band of a price: 0 = cheap, 1 = mid, 2 = expensive."""
+    # Written as "not <" so NaN lands in the expensive band, as it always has
+    return (not price < 0.50) + (not price < 5.00)
+
 class Model:
+    """One row of the price database (slotted: no per-instance __dict__).
+
+    Immutable: the lowercased names and display strings derived in __init__
+    can never go stale, so formatters read them directly.
+    """
+    _FIELDS = ("provider", "name", "input_price", "output_price",
+               "context", "category", "notes")
+    __slots__ = _FIELDS + ("_name_lc", "_provider_lc", "_input_str",
+                           "_input_tier", "_output_str", "_output_tier",
+                           "_ctx_str", "_icon")
+
     provider: str
     name: str
     input_price: float   # per 1M input tokens
     output_price: float  # per 1M output tokens
     context: int         # context window size
     category: str        # reasoning, general, fast, embedding, image
-    notes: str = ""
+    notes: str
+
+    def __init__(self, provider: str, name: str, input_price: float,
+                 output_price: float, context: int, category: str,
+                 notes: str = ""):
+        init = object.__setattr__  # bypass the read-only __setattr__ below
+        init(self, "provider", provider)
+        init(self, "name", name)
+        init(self, "input_price", input_price)
+        init(self, "output_price", output_price)
+        init(self, "context", context)
+        init(self, "category", category)
+        init(self, "notes", notes)
+        init(self, "_name_lc", name.lower())
+        init(self, "_provider_lc", provider.lower())
+        init(self, "_input_str", f"${input_price:.2f}")
+        init(self, "_input_tier", _price_tier(input_price))
+        init(self, "_output_str", f"${output_price:.2f}")
+        init(self, "_output_tier", _price_tier(output_price))
+        init(self, "_ctx_str", f"{context:,}")
+        init(self, "_icon", CATEGORY_ICON.get(category, ""))
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Model is immutable; cannot set {name!r}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Model is immutable; cannot delete {name!r}")
+
+    def __reduce__(self):
+        # copy/pickle rebuild through __init__ instead of setting slots
+        return (Model, tuple(getattr(self, f) for f in self._FIELDS))
+
+    def __repr__(self) -> str:
+        return (f"Model(provider={self.provider!r}, name={self.name!r}, "
+                f"input_price={self.input_price!r}, output_price={self.output_price!r}, "
+                f"context={self.context!r}, category={self.category!r}, notes={self.notes!r})")
 
-MODELS = [
+    def __eq__(self, other):
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        # Tuple comparison, as the dataclass did: identity first, so NaN == itself
+        return (tuple(getattr(self, f) for f in self._FIELDS) ==
+                tuple(getattr(other, f) for f in self._FIELDS))
+
+    def __hash__(self):
+        return hash(tuple(getattr(self, f) for f in self._FIELDS))
+
+MODELS = (
     # OpenAI
     Model("OpenAI", "GPT-5", 10.00, 30.00, 256000, "reasoning", "Latest flagship"),
     Model("OpenAI", "GPT-5-mini", 1.50, 6.00, 256000, "fast", "Efficient"),
@@ -90,7 +165,29 @@ MODELS = [
     Model("ByteDance", "Doubao Pro", 0.40, 1.20, 128000, "general", "ByteDance"),
     Model("Alibaba", "Qwen-Max", 1.60, 6.40, 128000, "reasoning", "Alibaba flagship"),
     Model("Alibaba", "Qwen-Plus", 0.40, 1.20, 128000, "general", "Budget Qwen"),
-]
+)
+
+# ─── Column Views ───────────────────────────────────────────────────────────
+# MODELS transposed once at import, in a single pass. Filtering, sorting and
+# costing work on row indices into these columns and only touch the fields
+# they need. The columns are import-time snapshots; that is safe because
+# MODELS is a tuple and Model is immutable, so neither can change afterwards.
+
+(_PROVIDERS, _NAMES, _INPUT_PRICES, _OUTPUT_PRICES, _CONTEXTS, _CATEGORIES,
+ _PROVIDERS_LC, _NAMES_LC, _CONTEXTS_DESC) = zip(*[
+    (m.provider, m.name, m.input_price, m.output_price, m.context, m.category,
+     m._provider_lc, m._name_lc, -m.context)
+    for m in MODELS
+])
+
+# --sort keys over row indices
+_SORT_KEYS = {
+    "input": _INPUT_PRICES.__getitem__,
+    "output": _OUTPUT_PRICES.__getitem__,
+    "provider": _PROVIDERS_LC.__getitem__,
+    "context": _CONTEXTS_DESC.__getitem__,
+    "name": _NAMES_LC.__getitem__,
+}
 
 # ─── Cost Calculator ────────────────────────────────────────────────────────
 
@@ -99,6 +196,27 @@ def calc_cost(model: Model, input_tokens: int, output_tokens: int) -> float:
     return (model.input_price * input_tokens / 1_000_000 + 
             model.output_price * output_tokens / 1_000_000)
 
+def calc_costs(input_tokens: int, output_tokens: int) -> List[float]:
+    """Calculate cost of every model in MODELS, in table order."""
+    # Batch form of calc_cost; keep the two expressions identical. Dividing by
+    # 1_000_000 (exact in binary) rather than multiplying by 1e-6 keeps
+    # displayed totals stable.
+    return [ip * input_tokens / 1_000_000 + op * output_tokens / 1_000_000
+            for ip, op in zip(_INPUT_PRICES, _OUTPUT_PRICES)]
+
+def rank_by_cost(input_tokens: int, output_tokens: int,
+                 budget: Optional[float] = None) -> List[Model]:
+    """Models ordered cheapest-first for a job, optionally within ``budget``.
+
+    Any ``budget`` other than None filters, so ``budget=0`` keeps only
+    zero-cost models; the CLI instead treats ``--budget 0`` as no budget.
+    """
+    costs = calc_costs(input_tokens, output_tokens)
+    rows = range(len(MODELS))
+    if budget is not None:
+        rows = [i for i in rows if costs[i] <= budget]
+    return [MODELS[i] for i in sorted(rows, key=costs.__getitem__)]
+
 # ─── Output Formatters ──────────────────────────────────────────────────────
 
 BOLD = "\033[1m"
@@ -109,133 +227,270 @@ YELLOW = "\033[33m"
 RED = "\033[31m"
 CYAN = "\033[36m"
 
-CATEGORY_ICON = {
-    "reasoning": "🧠",
-    "general": "⚡",
-    "fast": "🚀",
-    "embedding": "📐",
-    "image": "🖼️",
-}
+def format_price(price: float, color: bool = True) -> str:
+    # Static model prices are pre-rendered on each Model; this only formats
+    # dynamic values such as --calc costs, so it is not memoized
+    if not color:
+        return f"${price:.2f}"
+    return f"{(GREEN, YELLOW, RED)[_price_tier(price)]}${price:.2f}{RESET}"
 
-def format_price(price: float) -> str:
-    if price < 0.50:
-        return f"{GREEN}${price:.2f}{RESET}"
-    elif price < 5.00:
-        return f"{YELLOW}${price:.2f}{RESET}"
-    else:
-        return f"{RED}${price:.2f}{RESET}"
+def format_table(models: Sequence[Model], show_cost: bool = False,
+                 input_tokens: int = 0, output_tokens: int = 0,
+                 costs: Optional[Sequence[float]] = None,
+                 color: bool = True) -> str:
+    """Format as terminal table.
 
-def format_table(models: List[Model], show_cost: bool = False,
-                 input_tokens: int = 0, output_tokens: int = 0) -> str:
-    """Format as terminal table."""
-    lines = []
-    lines.append(f"\n{BOLD}💰 llm-price-tracker v{__version__}{RESET}")
-    lines.append(f"{DIM}{'─' * 95}{RESET}")
+    ``costs``, if given, holds the precomputed cost of each entry in ``models``.
+    ``color=False`` leaves out all ANSI styling.
+    """
+    # Styles are read now, so reassigned constants apply
+    if color:
+        bold, dim, reset, colors = BOLD, DIM, RESET, (GREEN, YELLOW, RED)
+    else:
+        bold = dim = reset = ""
+        colors = ("", "", "")
+    
+    buf = StringIO()
+    w = buf.write
+    w(f"\n{bold}💰 llm-price-tracker v{__version__}{reset}\n")
+    w(f"{dim}{'─' * 95}{reset}\n")
     
     if show_cost:
-        lines.append(f"  Cost estimate for {BOLD}{input_tokens:,}{RESET} input + {BOLD}{output_tokens:,}{RESET} output tokens\n")
+        w(f"  Cost estimate for {bold}{input_tokens:,}{reset} input + {bold}{output_tokens:,}{reset} output tokens\n\n")
         header = f"  {'Provider':<12} {'Model':<24} {'Input/1M':>10} {'Output/1M':>10} {'Context':>10} {'Cat':>4} {'Cost':>10}"
     else:
         header = f"  {'Provider':<12} {'Model':<24} {'Input/1M':>10} {'Output/1M':>10} {'Context':>10} {'Cat':>4}"
     
-    lines.append(f"{BOLD}{header}{RESET}")
-    lines.append(f"  {'─' * 90}")
+    w(f"{bold}{header}{reset}\n")
+    w(f"  {'─' * 90}\n")
     
+    if show_cost and costs is None:
+        costs = [calc_cost(m, input_tokens, output_tokens) for m in models]
+    elif show_cost and len(costs) != len(models):
+        raise ValueError(f"got {len(costs)} costs for {len(models)} models")
+    
+    # Price cells show 11 columns; pad widths also cover any colour codes
+    pw = 11 + len(colors[0]) + len(reset)
+    cells = [(m.provider, m.name,
+              colors[m._input_tier] + m._input_str + reset,
+              colors[m._output_tier] + m._output_str + reset,
+              m._ctx_str, m._icon) for m in models]
+    
+    if show_cost:
+        row_fmt = f"  {{:<12}} {{:<24}} {{:>{pw}}} {{:>{pw}}} {{:>10}} {{:>4}} {{:>{pw}}}\n".format
+        buf.writelines([row_fmt(*c, format_price(cost, color)) for c, cost in zip(cells, costs)])
+    else:
+        row_fmt = f"  {{:<12}} {{:<24}} {{:>{pw}}} {{:>{pw}}} {{:>10}} {{:>4}}\n".format
+        buf.writelines(starmap(row_fmt, cells))
+    
+    w(f"\n{dim}  Prices per 1M tokens (USD). Last updated: 2026-02-12{reset}\n")
+    w(f"{dim}  ⚠ Prices change frequently. Verify at provider's pricing page.{reset}\n")
+    return buf.getvalue()
+
+_INF = float("inf")
+
+# (JSON key, Model attribute) of each --json record, in output order
+_JSON_FIELDS = (
+    ("provider", "provider"), ("model", "name"),
+    ("input_price_per_1m", "input_price"), ("output_price_per_1m", "output_price"),
+    ("context_window", "context"), ("category", "category"), ("notes", "notes"),
+)
+
+# One JSON object, laid out exactly as json.dumps(..., indent=2) would
+_JSON_RECORD = (
+    "  {{\n" + ",\n".join(f'    "{key}": {{}}' for key, _ in _JSON_FIELDS) + "\n  }}"
+).format
+
+def _json_plain(x) -> bool:
+    # Exact str/int/finite float, which the fixed layout spells as json does;
+    # anything else (None, bool, containers, subclasses, NaN) needs json itself
+    t = type(x)
+    return t is str or t is int or (t is float and -_INF < x < _INF)
+
+def _orjson_plain(x) -> bool:
+    # The plain values orjson spells exactly as json.dumps does; it writes
+    # non-ASCII and DEL raw, small floats as 1e-7, and rejects ints past 64 bits
+    t = type(x)
+    if t is str:
+        return x.isascii() and "\x7f" not in x
+    if t is int:
+        return -2**63 <= x < 2**64
+    return t is float and (1e-4 <= abs(x) < _INF or x == 0)
+
+_orjson = False  # optional speedup (pip install llm-price-tracker[fast]); None if missing
+
+def format_json(models: Sequence[Model]) -> str:
+    global _orjson
+    if not models:
+        return "[]"
+    attrs = [attr for _, attr in _JSON_FIELDS]
+    rows = [[getattr(m, a) for a in attrs] for m in models]
+    if _orjson is False:
+        try:
+            import orjson as _orjson
+        except ImportError:
+            _orjson = None
+    if _orjson is not None and all([_orjson_plain(x) for row in rows for x in row]):
+        keys = [key for key, _ in _JSON_FIELDS]
+        return _orjson.dumps([dict(zip(keys, row)) for row in rows],
+                             option=_orjson.OPT_INDENT_2).decode()
+    if not all([_json_plain(x) for row in rows for x in row]):
+        import json
+        keys = [key for key, _ in _JSON_FIELDS]
+        return json.dumps([dict(zip(keys, row)) for row in rows], indent=2)
+    
+    # indent=2 forces json's pure-Python encoder, so values are encoded one at
+    # a time (strings by json's C escaper) and dropped into the fixed layout
+    try:  # json's C escaper, without importing json itself (which loads re)
+        from _json import encode_basestring_ascii as enc
+    except ImportError:
+        from json.encoder import encode_basestring_ascii as enc
+    return "[\n" + ",\n".join([
+        _JSON_RECORD(*[enc(x) if type(x) is str else repr(x) for x in row])
+        for row in rows
+    ]) + "\n]"
+
+def format_markdown(models: Sequence[Model]) -> str:
+    buf = StringIO()
+    w = buf.write
+    w("# 💰 LLM Price Comparison\n\n")
+    w(f"*Last updated: 2026-02-12*\n\n")
+    w("| Provider | Model | Input/1M | Output/1M | Context | Category |\n")
+    w("|----------|-------|----------|-----------|---------|----------|")
     for m in models:
-        icon = CATEGORY_ICON.get(m.category, "")
-        ctx = f"{m.context:,}"
-        ip = format_price(m.input_price)
-        op = format_price(m.output_price)
-        
-        if show_cost:
-            cost = calc_cost(m, input_tokens, output_tokens)
-            cost_str = format_price(cost)
-            lines.append(f"  {m.provider:<12} {m.name:<24} {ip:>20} {op:>20} {ctx:>10} {icon:>4} {cost_str:>20}")
-        else:
-            lines.append(f"  {m.provider:<12} {m.name:<24} {ip:>20} {op:>20} {ctx:>10} {icon:>4}")
-    
-    lines.append(f"\n{DIM}  Prices per 1M tokens (USD). Last updated: 2026-02-12{RESET}")
-    lines.append(f"{DIM}  ⚠ Prices change frequently. Verify at provider's pricing page.{RESET}\n")
-    return '\n'.join(lines)
-
-def format_json(models: List[Model]) -> str:
-    return json.dumps([{
-        "provider": m.provider, "model": m.name,
-        "input_price_per_1m": m.input_price, "output_price_per_1m": m.output_price,
-        "context_window": m.context, "category": m.category, "notes": m.notes,
-    } for m in models], indent=2)
-
-def format_markdown(models: List[Model]) -> str:
-    lines = ["# 💰 LLM Price Comparison\n"]
-    lines.append(f"*Last updated: 2026-02-12*\n")
-    lines.append("| Provider | Model | Input/1M | Output/1M | Context | Category |")
-    lines.append("|----------|-------|----------|-----------|---------|----------|")
-    for m in models:
-        lines.append(f"| {m.provider} | {m.name} | ${m.input_price:.2f} | ${m.output_price:.2f} | {m.context:,} | {m.category} |")
-    return '\n'.join(lines)
+        w(f"\n| {m.provider} | {m.name} | {m._input_str} | {m._output_str} | {m._ctx_str} | {m.category} |")
+    return buf.getvalue()
 
 # ─── CLI ─────────────────────────────────────────────────────────────────────
 
-def main():
+SORT_CHOICES = ("input", "output", "provider", "context", "name")
+CATEGORY_CHOICES = ("reasoning", "general", "fast")
+
+# Single source of truth for the CLI: argparse and _parse_args_fast are both
+# built from this table (flags, add_argument keyword arguments).
+_CLI_OPTIONS = (
+    (("--sort", "-s"), dict(choices=SORT_CHOICES, default="output",
+                           help="Sort by field (default: output)")),
+    (("--filter", "-f"), dict(help="Filter by model/provider name")),
+    (("--category", "-c"), dict(choices=CATEGORY_CHOICES, help="Filter by category")),
+    (("--calc",), dict(nargs=2, type=int, metavar=("IN", "OUT"),
+                       help="Calculate cost for IN input and OUT output tokens")),
+    (("--budget", "-b"), dict(type=float,
+                              help="Show models within budget (for --calc tokens)")),
+    (("--json",), dict(action="store_true", help="Output as JSON")),
+    (("--markdown",), dict(action="store_true", help="Output as Markdown")),
+    (("--cheap",), dict(action="store_true", help="Sort cheapest first (by output)")),
+)
+
+def _build_parser():
+    import argparse
     parser = argparse.ArgumentParser(
         prog="llm-price-tracker",
         description="💰 Compare LLM API prices across providers",
     )
-    parser.add_argument("--sort", "-s", choices=["input", "output", "provider", "context", "name"],
-                       default="output", help="Sort by field (default: output)")
-    parser.add_argument("--filter", "-f", help="Filter by model/provider name")
-    parser.add_argument("--category", "-c", choices=["reasoning", "general", "fast"],
-                       help="Filter by category")
-    parser.add_argument("--calc", nargs=2, type=int, metavar=("IN", "OUT"),
-                       help="Calculate cost for IN input and OUT output tokens")
-    parser.add_argument("--budget", "-b", type=float,
-                       help="Show models within budget (for --calc tokens)")
-    parser.add_argument("--json", action="store_true", help="Output as JSON")
-    parser.add_argument("--markdown", action="store_true", help="Output as Markdown")
-    parser.add_argument("--cheap", action="store_true", help="Sort cheapest first (by output)")
+    for flags, kwargs in _CLI_OPTIONS:
+        parser.add_argument(*flags, **kwargs)
     parser.add_argument("--version", "-v", action="version", version=f"llm-price-tracker {__version__}")
+    return parser
+
+# _CLI_OPTIONS indexed for _parse_args_fast: flag -> (dest, kwargs), and the
+# defaults argparse would give each dest
+_CLI_FLAGS = {flag: (flags[0][2:], kwargs)
+              for flags, kwargs in _CLI_OPTIONS for flag in flags}
+_CLI_DEFAULTS = {
+    flags[0][2:]: kwargs.get("default", False if kwargs.get("action") == "store_true" else None)
+    for flags, kwargs in _CLI_OPTIONS
+}
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """Parse the common flag forms without importing argparse.
+
+    Returns None for anything it does not fully understand (help, version,
+    abbreviations, bad values, ...), so argparse can handle it and report
+    errors exactly as before.
+    """
+    opts = dict(_CLI_DEFAULTS)
+    i, n = 0, len(argv)
+    while i < n:
+        arg = argv[i]
+        i += 1
+        flag, eq, value = arg.partition("=") if arg.startswith("--") else (arg, "", "")
+        spec = _CLI_FLAGS.get(flag)
+        if spec is None:
+            return None
+        dest, kwargs = spec
+        
+        if kwargs.get("action") == "store_true":
+            if eq:
+                return None
+            opts[dest] = True
+            continue
+        
+        nargs = kwargs.get("nargs")
+        if eq:
+            if nargs is not None:
+                return None
+            values = [value]
+        else:
+            values = argv[i:i + (nargs or 1)]
+            if len(values) < (nargs or 1) or any(v.startswith("-") for v in values):
+                return None
+            i += len(values)
+        
+        convert = kwargs.get("type", str)
+        try:
+            values = [convert(v) for v in values]
+        except ValueError:
+            return None
+        choices = kwargs.get("choices")
+        if choices is not None and any(v not in choices for v in values):
+            return None
+        opts[dest] = values if nargs is not None else values[0]
+    return SimpleNamespace(**opts)
+
+def main():
+    args = _parse_args_fast(sys.argv[1:]) or _build_parser().parse_args()
+    color = not os.environ.get("NO_COLOR") and sys.stdout.isatty()
+    # Work on indices into MODELS; Model objects are only picked for output.
+    # range() is a view: nothing is copied until a filter or sort needs a list
+    rows = range(len(MODELS))
     
-    args = parser.parse_args()
-    models = list(MODELS)
-    
-    # Filter
-    if args.filter:
-        q = args.filter.lower()
-        models = [m for m in models if q in m.name.lower() or q in m.provider.lower()]
-    
-    if args.category:
-        models = [m for m in models if m.category == args.category]
+    # Costs are computed once and shared by the budget filter, sort and table
+    costs = calc_costs(*args.calc) if args.calc else None
     
-    # Sort
-    sort_keys = {
-        "input": lambda m: m.input_price,
-        "output": lambda m: m.output_price,
-        "provider": lambda m: m.provider.lower(),
-        "context": lambda m: -m.context,
-        "name": lambda m: m.name.lower(),
-    }
+    # Filter (name/provider, category and --budget in a single pass)
+    q = args.filter.lower() if args.filter else None
+    cat = args.category
+    budget = args.budget if costs is not None else None
+    if q or cat or budget:
+        rows = [i for i in rows
+                if (not q or q in _NAMES_LC[i] or q in _PROVIDERS_LC[i])
+                and (not cat or _CATEGORIES[i] == cat)
+                and (not budget or costs[i] <= budget)]
     
+    # Sort; the --calc table then orders by cost, ties keeping the --sort order
     if args.cheap:
-        models.sort(key=lambda m: m.output_price)
+        rows = sorted(rows, key=_SORT_KEYS["output"])
     else:
-        models.sort(key=sort_keys.get(args.sort, sort_keys["output"]))
-    
-    # Budget filter
-    if args.budget and args.calc:
-        input_t, output_t = args.calc
-        models = [m for m in models if calc_cost(m, input_t, output_t) <= args.budget]
+        rows = sorted(rows, key=_SORT_KEYS.get(args.sort, _SORT_KEYS["output"]))
+    show_cost = costs is not None and not (args.json or args.markdown)
+    if show_cost:
+        rows.sort(key=costs.__getitem__)
+    models = [MODELS[i] for i in rows]
     
     # Output
     if args.json:
-        print(format_json(models))
+        out = format_json(models)
     elif args.markdown:
-        print(format_markdown(models))
-    elif args.calc:
+        out = format_markdown(models)
+    elif show_cost:
         input_t, output_t = args.calc
-        models.sort(key=lambda m: calc_cost(m, input_t, output_t))
-        print(format_table(models, show_cost=True, input_tokens=input_t, output_tokens=output_t))
+        out = format_table(models, show_cost=True,
+                           input_tokens=input_t, output_tokens=output_t,
+                           costs=[costs[i] for i in rows], color=color)
     else:
-        print(format_table(models))
+        out = format_table(models, color=color)
+    sys.stdout.write(out + "\n")
 
 if __name__ == "__main__":
     main()
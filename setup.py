@@ -9,5 +9,6 @@ setup(
     url="https://github.com/leiMizzou/llm-price-tracker",
     py_modules=["llm_prices"],
     python_requires=">=3.8",
+    extras_require={"fast": ["orjson"]},
     entry_points={"console_scripts": ["llm-price-tracker=llm_prices:main"]},
 )
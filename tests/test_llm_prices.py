@@ -0,0 +1,237 @@
+"""Tests for llm_prices. Run with: python -m unittest discover -s tests"""
+
+import contextlib
+import copy
+import io
+import json
+import os
+import pickle
+import random
+import re
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+import llm_prices  # noqa: E402
+from llm_prices import MODELS, Model  # noqa: E402
+
+
+class ModelTest(unittest.TestCase):
+    def test_fields_are_read_only(self):
+        m = MODELS[1]
+        with self.assertRaises(AttributeError):
+            m.output_price = 99.0
+        with self.assertRaises(AttributeError):
+            del m.name
+        self.assertIn("$6.00", llm_prices.format_markdown([m]))
+
+    def test_copy_pickle_and_hash(self):
+        m = MODELS[0]
+        self.assertEqual(copy.copy(m), m)
+        self.assertEqual(pickle.loads(pickle.dumps(m)), m)
+        self.assertEqual(hash(copy.deepcopy(m)), hash(m))
+        self.assertNotEqual(m, Model(m.provider, m.name, 0.0, 0.0, 1, "fast"))
+
+    def test_nan_price_equals_itself(self):
+        m = Model("a", "b", float("nan"), 1.0, 1, "fast")
+        self.assertEqual(m, m)
+        self.assertIn(m, {m})
+
+
+class ColumnViewTest(unittest.TestCase):
+    def test_columns_match_models(self):
+        for i, m in enumerate(MODELS):
+            self.assertEqual(llm_prices._NAMES[i], m.name)
+            self.assertEqual(llm_prices._INPUT_PRICES[i], m.input_price)
+            self.assertEqual(llm_prices._OUTPUT_PRICES[i], m.output_price)
+            self.assertEqual(llm_prices._CONTEXTS_DESC[i], -m.context)
+        self.assertIsInstance(MODELS, tuple)
+
+
+class CostTest(unittest.TestCase):
+    def test_batch_matches_calc_cost(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            i, o = rng.randint(0, 10**7), rng.randint(0, 10**7)
+            self.assertEqual(llm_prices.calc_costs(i, o),
+                             [llm_prices.calc_cost(m, i, o) for m in MODELS])
+
+    def test_table_fallback_uses_calc_cost(self):
+        costs = [llm_prices.calc_cost(m, 100000, 50000) for m in MODELS]
+        self.assertEqual(llm_prices.format_table(MODELS, True, 100000, 50000),
+                         llm_prices.format_table(MODELS, True, 100000, 50000, costs))
+
+    def test_rank_by_cost(self):
+        for i, o in ((0, 0), (1000, 2000), (100000, 50000), (10**6, 0)):
+            ranked = sorted(MODELS, key=lambda m: llm_prices.calc_cost(m, i, o))
+            self.assertEqual(llm_prices.rank_by_cost(i, o), ranked)
+            for budget in (0, 0.01, 1.0):
+                self.assertEqual(
+                    llm_prices.rank_by_cost(i, o, budget),
+                    [m for m in ranked if llm_prices.calc_cost(m, i, o) <= budget])
+        self.assertEqual(llm_prices.rank_by_cost(1000, 1000, 0), [])
+
+    def test_table_rejects_mismatched_costs(self):
+        with self.assertRaises(ValueError):
+            llm_prices.format_table(MODELS[:3], True, 1000, 1000, costs=[0.1])
+
+
+class FormatPriceTest(unittest.TestCase):
+    def test_signed_zero(self):
+        self.assertIn("$0.00", llm_prices.format_price(0.0))
+        self.assertIn("$-0.00", llm_prices.format_price(-0.0))
+
+    def test_tiers(self):
+        for price, tier in ((0.0, 0), (0.49, 0), (0.5, 1), (4.99, 1), (5.0, 2),
+                            (100.0, 2), (float("nan"), 2)):
+            self.assertEqual(llm_prices._price_tier(price), tier, price)
+
+    def test_colours_read_at_call_time(self):
+        green = llm_prices.GREEN
+        llm_prices.GREEN = "<g>"
+        try:
+            self.assertEqual(llm_prices.format_price(0.1), "<g>$0.10" + llm_prices.RESET)
+            self.assertIn("<g>$0.15", llm_prices.format_table(MODELS[3:4]))
+        finally:
+            llm_prices.GREEN = green
+
+
+class ColorTest(unittest.TestCase):
+    def test_plain_table_has_no_escapes_and_same_layout(self):
+        colored = llm_prices.format_table(MODELS, True, 1000, 2000)
+        plain = llm_prices.format_table(MODELS, True, 1000, 2000, color=False)
+        self.assertNotIn("\033[", plain)
+        self.assertEqual(re.sub(r"\033\[[0-9;]*m", "", colored), plain)
+
+    def test_main_leaves_module_colours_alone(self):
+        argv = sys.argv
+        sys.argv = ["llm-price-tracker", "--calc", "1000", "2000"]
+        try:
+            with contextlib.redirect_stdout(io.StringIO()) as out:
+                llm_prices.main()
+        finally:
+            sys.argv = argv
+        self.assertNotIn("\033[", out.getvalue())
+        self.assertIn("\033[", llm_prices.format_table(MODELS))
+        self.assertIn("\033[", llm_prices.format_price(1.0))
+
+
+class FormatJsonTest(unittest.TestCase):
+    def setUp(self):
+        # Exercise the stdlib path even when the optional orjson is installed
+        self._orjson = llm_prices._orjson
+        llm_prices._orjson = None
+
+    def tearDown(self):
+        llm_prices._orjson = self._orjson
+
+    @staticmethod
+    def reference(models):
+        return json.dumps([{
+            key: getattr(m, attr) for key, attr in llm_prices._JSON_FIELDS
+        } for m in models], indent=2)
+
+    def test_matches_json_dumps(self):
+        class Price(float):
+            def __repr__(self):
+                return f"Price({float(self)})"
+
+        models = list(MODELS) + [
+            Model('Ün"x', "a\\b\n", 1e-7, float("inf"), 10**20, "x", "中文"),
+            Model("a", "b", float("nan"), -float("inf"), 3, "c", None),
+            Model("a", "b", Price(1.5), True, False, "c"),
+            Model("a", "b", 1.0, 2.0, 3, "c", {"k": 1, "l": [1, "x"]}),
+            Model("a", "b", 1.0, 2.0, 3, "c", ["x", {"y": None}]),
+        ]
+        for k in range(len(models) + 1):
+            self.assertEqual(llm_prices.format_json(models[:k]),
+                             self.reference(models[:k]))
+
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@unittest.skipUnless(orjson, "orjson not installed")
+class FormatJsonOrjsonTest(unittest.TestCase):
+    def stdlib(self, models):
+        saved, llm_prices._orjson = llm_prices._orjson, None
+        try:
+            return llm_prices.format_json(models)
+        finally:
+            llm_prices._orjson = saved
+
+    def test_matches_stdlib_path(self):
+        models = list(MODELS) + [
+            Model("Ü", "\x7f", 1e-7, float("nan"), 2**64, "x", "中文"),
+            Model("a", "b", 1.0, 2.0, -2**63 - 1, "c", {"k": [1]}),
+        ]
+        for k in range(len(models) + 1):
+            self.assertEqual(llm_prices.format_json(models[:k]), self.stdlib(models[:k]))
+        self.assertIsNotNone(llm_prices._orjson)
+
+
+class ParseArgsFastTest(unittest.TestCase):
+    """_parse_args_fast must agree with argparse whenever it accepts argv."""
+
+    TOKENS = [
+        "--sort", "-s", "input", "output", "name", "bogus", "--filter", "-f",
+        "claude", "", "-x", "--category", "-c", "fast", "general", "--calc",
+        "100", "-5", "x", "3.5", "--budget", "-b", "0.5", "nan", "1e3",
+        "--json", "--markdown", "--cheap", "--sort=input", "--filter=",
+        "--filter=-q", "--budget=2", "-s=name", "--cat", "--", "-", "-v",
+        "-h", "--calc=1", "--json=1", "-fclaude",
+    ]
+
+    def setUp(self):
+        self.parser = llm_prices._build_parser()
+
+    def argparse(self, argv):
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            try:
+                return vars(self.parser.parse_args(argv))
+            except SystemExit:
+                return None
+
+    def assertAgrees(self, argv):
+        fast = llm_prices._parse_args_fast(argv)
+        if fast is None:
+            return False
+        expected = self.argparse(argv)
+        self.assertIsNotNone(expected, f"argparse rejects {argv!r}")
+        actual = vars(fast)
+        self.assertEqual(actual.keys(), expected.keys(), argv)
+        for key, value in expected.items():
+            if value != value:  # NaN budget
+                self.assertNotEqual(actual[key], actual[key], argv)
+            else:
+                self.assertEqual(actual[key], value, argv)
+        return True
+
+    def test_common_invocations(self):
+        for argv in ([], ["--cheap"], ["--sort", "input"], ["-s", "name"],
+                     ["--filter", "claude"], ["-c", "fast", "-f", "o"],
+                     ["--calc", "100000", "50000", "--budget", "0.50"],
+                     ["--json", "--filter=meta"], ["--markdown", "-b", "1"]):
+            self.assertTrue(self.assertAgrees(argv), argv)
+
+    def test_defers_to_argparse(self):
+        for argv in (["-h"], ["--version"], ["--cat", "fast"], ["--sort", "bogus"],
+                     ["--calc", "1"], ["--calc", "x", "1"], ["--json=1"], ["extra"]):
+            self.assertIsNone(llm_prices._parse_args_fast(argv), argv)
+
+    def test_random_argv(self):
+        rng = random.Random(1)
+        accepted = 0
+        for _ in range(5000):
+            argv = [rng.choice(self.TOKENS) for _ in range(rng.randint(0, 6))]
+            accepted += self.assertAgrees(argv)
+        self.assertGreater(accepted, 500)
+
+
+if __name__ == "__main__":
+    unittest.main()